@@ -1,10 +1,151 @@
 
+import asyncio
+import heapq
+import itertools
 import os
 import tempfile
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
 from io import BytesIO
 
+from requests import Session
+from requests.adapters import HTTPAdapter
+from azure.core import MatchConditions
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
 from azure.storage.blob import BlobPrefix, ContainerClient, generate_blob_sas, BlobSasPermissions
+from azure.storage.blob.aio import ContainerClient as AioContainerClient
+
+
+def _preallocate(file, size: int) -> None:
+    """
+    Reserve `size` bytes on disk for an open file so chunked writes don't repeatedly extend it.
+    Silently does nothing where posix_fallocate is unavailable or unsupported by the filesystem.
+    """
+    if size > 0 and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(file.fileno(), 0, size)
+        except OSError:
+            pass
+
+
+def _read_to_memory(downloader) -> BytesIO:
+    """
+    Read a blob download into a BytesIO sized to the blob up front, so parallel chunks are
+    written in place instead of repeatedly growing the buffer. The stream is returned at position 0.
+    """
+    stream = BytesIO()
+    if downloader.size:
+        stream.seek(downloader.size - 1)
+        stream.write(b"\0")
+        stream.seek(0)
+    downloader.readinto(stream)
+    stream.seek(0)
+    return stream
+
+
+class _BlobCache:
+    """
+    Thread-safe LRU cache of blob contents keyed by path, bounded by total bytes.
+    Each entry stores the blob's ETag so callers can revalidate it before use.
+    """
+
+    def __init__(self, max_bytes: int, max_item_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self._entries = OrderedDict()  # path -> (etag, data)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str):
+        """Return (etag, data) for a cached path, or None."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+            return entry
+
+    def put(self, path: str, etag: str, data: bytes) -> None:
+        """Store a blob's content, evicting least recently used entries to stay within budget."""
+        if len(data) > self.max_item_bytes or len(data) > self.max_bytes:
+            self.invalidate(path)
+            return
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._size -= len(old[1])
+            self._entries[path] = (etag, data)
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def invalidate(self, path: str) -> None:
+        """Drop a cached path, if present."""
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._size -= len(old[1])
+
+
+class _ListingCache:
+    """
+    Thread-safe cache of container listings keyed by (kind, prefix), kept for `ttl` seconds.
+    Holds at most `max_entries` listings, evicting the least recently used; expired entries
+    are dropped as soon as they are seen.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (kind, prefix) -> (time, names)
+        self._lock = threading.Lock()
+
+    def _fresh(self, key):
+        # Caller holds the lock
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def get(self, kind: str, prefix: str):
+        """Return the cached names for (kind, prefix) if still fresh, otherwise None."""
+        with self._lock:
+            return self._fresh((kind, prefix))
+
+    def get_covering(self, kind: str, prefix: str):
+        """Return a fresh listing of `prefix` or of any ancestor prefix, otherwise None."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == kind and prefix.startswith(key[1])]:
+                names = self._fresh(key)
+                if names is not None:
+                    return names
+        return None
+
+    def put(self, kind: str, prefix: str, names) -> None:
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            for key in [key for key, (added, _) in self._entries.items() if now - added > self.ttl]:
+                del self._entries[key]
+            self._entries[(kind, prefix)] = (now, names)
+            self._entries.move_to_end((kind, prefix))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        """Drop every listing whose prefix contains `path`."""
+        with self._lock:
+            for key in [key for key in self._entries if path.startswith(key[1])]:
+                del self._entries[key]
 
 
 class BlobStorageHelper:
@@ -15,13 +156,23 @@ class BlobStorageHelper:
 
     Attributes:
         container_client (ContainerClient): The Azure Blob container client.
+        aio_container (AioContainerClient): Async container client shared by the `a*` methods.
+            Created on first use (requires aiohttp) and bound to that event loop; use the helper
+            as `async with helper:` or release it with `aclose()` before the loop ends.
     """
 
     def __init__(
         self,
         conn_str: str | None = None,
         container: str | None = None,
-        sas_url: str | None = None
+        sas_url: str | None = None,
+        max_concurrency: int | None = None,
+        max_single_get_size: int = 16 * 1024 * 1024,
+        max_chunk_get_size: int = 16 * 1024 * 1024,
+        cache_size: int = 256 * 1024 * 1024,
+        max_cache_blob_size: int = 32 * 1024 * 1024,
+        listing_cache_ttl: float = 30.0,
+        listing_cache_size: int = 128,
     ) -> None:
         """
         Initialize the helper with either a connection string and container name, or a SAS token URL.
@@ -30,22 +181,117 @@ class BlobStorageHelper:
             conn_str (str, optional): Azure storage account connection string.
             container (str, optional): Name of the container to interact with.
             sas_url (str, optional): SAS token URL for the container.
+            max_concurrency (int, optional): Parallel connections used per blob transfer.
+                Defaults to twice the CPU count.
+            max_single_get_size (int): Size of the first download request. Blobs up to this size
+                are fetched in a single request. Default is 16 MiB.
+            max_chunk_get_size (int): Size of each subsequent ranged download request. Default is 16 MiB.
+                Keep both sizes at 4 MiB or above: many small ranged requests download large blobs
+                far slower than fewer large ones.
+            cache_size (int): Total bytes of blob content kept in memory by `read_data` and
+                `read_data_to_memory`. Default is 256 MiB; 0 disables caching.
+            max_cache_blob_size (int): Blobs larger than this are never cached. Default is 32 MiB.
+            listing_cache_ttl (float): Seconds that `list_blobs` / `list_subdirectories` results are
+                reused. Default is 30; 0 disables listing caching.
+            listing_cache_size (int): Maximum number of listings kept. Default is 128.
         """
         self.created_with_connection_string = None
         self.created_with_sas_token = None
+        self.max_concurrency = max_concurrency or (os.cpu_count() or 1) * 2
+        self._cache = _BlobCache(cache_size, max_cache_blob_size)
+        self._listings = _ListingCache(listing_cache_ttl, listing_cache_size)
+        self._client_kwargs = {
+            "max_single_get_size": max_single_get_size,
+            "max_chunk_get_size": max_chunk_get_size,
+        }
+        # The default requests pool keeps 10 connections per host, fewer than max_concurrency
+        # parallel chunk transfers need; share one larger pool across every call
+        self._pool_size = max(256, self.max_concurrency)
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=self._pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        transport = RequestsTransport(session=session, session_owner=True)
         if sas_url:
             self.created_with_sas_token = True
             self.sas_url = sas_url
-            self.container_client = ContainerClient.from_container_url(sas_url)
+            self.container_client = ContainerClient.from_container_url(
+                sas_url, transport=transport, **self._client_kwargs
+            )
         elif conn_str and container:
             self.created_with_connection_string = True  # some functions can only work with container created with connection string
             self.conn_str = conn_str
             self.container_name = container
             self.container_client = ContainerClient.from_connection_string(
-                conn_str, container_name=container
+                conn_str, container_name=container, transport=transport, **self._client_kwargs
+            )
+            # (account name, container name, account key, container URL) used to sign blob SAS tokens
+            account_name = self.container_client.account_name
+            container_name = self.container_client.container_name
+            self._sas_ctx = (
+                account_name,
+                container_name,
+                getattr(self.container_client.credential, "account_key", None),
+                f"https://{account_name}.blob.core.windows.net/{container_name}",
             )
         else:
             raise ValueError("Must provide either sas_url or both conn_str and container.")
+        self._aio_container = None
+        self._aio_loop = None
+        self._aio_users = 0  # open `async with helper:` blocks sharing the async client
+        self._blob_clients = OrderedDict()  # path -> BlobClient, least recently used first
+        self._blob_clients_lock = threading.Lock()
+
+    @property
+    def aio_container(self):
+        """
+        Async container client, built once and reused so concurrent requests share one pipeline.
+        It is bound to the running event loop it was created in; access it inside
+        `async with helper:` or close it with `aclose()` before that loop finishes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aio_container is not None and self._aio_loop is not loop:
+            raise RuntimeError(
+                "The async container client belongs to another event loop; call `await helper.aclose()` "
+                "before that loop ends, or use `async with helper:`."
+            )
+        if self._aio_container is None:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError("The async methods require aiohttp: pip install pyazure[async]")
+            from azure.core.pipeline.transport import AioHttpTransport
+
+            connector = aiohttp.TCPConnector(limit=self._pool_size, limit_per_host=self._pool_size // 2)
+            transport = AioHttpTransport(session=aiohttp.ClientSession(connector=connector), session_owner=True)
+            if self.created_with_sas_token:
+                self._aio_container = AioContainerClient.from_container_url(
+                    self.sas_url, transport=transport, **self._client_kwargs
+                )
+            else:
+                self._aio_container = AioContainerClient.from_connection_string(
+                    self.conn_str, container_name=self.container_name, transport=transport, **self._client_kwargs
+                )
+            self._aio_loop = loop
+        return self._aio_container
+
+    async def aclose(self):
+        """Close the shared async container client, if it was created."""
+        if self._aio_container is not None:
+            await self._aio_container.close()
+            self._aio_container = None
+            self._aio_loop = None
+
+    async def __aenter__(self):
+        self.aio_container  # build the client for this loop, or refuse one left open by another loop
+        self._aio_users += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._aio_users -= 1
+        if self._aio_users == 0:
+            await self.aclose()
+
     def list_blobs(self, prefix: str = ""):
         """
         List all blobs in the container recursively, optionally filtered by a prefix.
@@ -55,7 +301,27 @@ class BlobStorageHelper:
         Returns:
             List[str]: A list of blob names.
         """
-        return [blob.name for blob in self.container_client.list_blobs(name_starts_with=prefix)]
+        names = self._listings.get("blobs", prefix)
+        if names is None:
+            names = list(self._iter_blobs(prefix))
+            self._listings.put("blobs", prefix, names)
+        return list(names)
+
+    def iter_blobs(self, prefix: str = ""):
+        """
+        Yield blob names under a prefix as listing pages arrive, without building the full list.
+
+        Args:
+            prefix (str, optional): Path prefix within the blob container. Defaults to "".
+        Yields:
+            str: Blob names.
+        """
+        return self._iter_blobs(prefix)
+
+    def _iter_blobs(self, prefix: str = ""):
+        # 5000 is the service maximum page size, 10x fewer LIST calls than the default
+        for blob in self.container_client.list_blobs(name_starts_with=prefix, results_per_page=5000):
+            yield blob.name
 
     def list_subdirectories(self, folder: str = "."):
         """
@@ -75,19 +341,39 @@ class BlobStorageHelper:
         else:
             prefix = folder if folder.endswith("/") else folder + "/"
 
-        return [
-            item.name
-            for item in self.container_client.walk_blobs(
-                name_starts_with=prefix, delimiter="/"
-            )
-            if isinstance(item, BlobPrefix)
-        ]
+        names = self._listings.get("subdirectories", prefix)
+        if names is None:
+            names = [
+                item.name
+                for item in self.container_client.walk_blobs(
+                    name_starts_with=prefix, delimiter="/"
+                )
+                if isinstance(item, BlobPrefix)
+            ]
+            self._listings.put("subdirectories", prefix, names)
+        return list(names)
 
     def get_blob_client(self, path: str):
         """Return a blob client for the given blob path."""
         return self.container_client.get_blob_client(path)
 
-    def download_blob_to_local(self, blob_path: str, local_file_path: str, binary: bool = True):
+    def _get_blob_client_cached(self, path: str):
+        """Return a blob client for `path`, reusing one of the last 1024 clients built."""
+        with self._blob_clients_lock:
+            blob_client = self._blob_clients.get(path)
+            if blob_client is not None:
+                self._blob_clients.move_to_end(path)
+                return blob_client
+        blob_client = self.get_blob_client(path)
+        with self._blob_clients_lock:
+            self._blob_clients[path] = blob_client
+            if len(self._blob_clients) > 1024:
+                self._blob_clients.popitem(last=False)
+        return blob_client
+
+    def download_blob_to_local(
+        self, blob_path: str, local_file_path: str, binary: bool = True, max_concurrency: int | None = None
+    ):
         """
         Download a blob to a local file.
 
@@ -95,69 +381,197 @@ class BlobStorageHelper:
             blob_path (str): Path of the blob to download.
             local_file_path (str): Local file path to save the downloaded blob.
             binary (bool): If True, download the blob as binary. If False, download as text.
+            max_concurrency (int, optional): Parallel connections for this download. Defaults to `self.max_concurrency`.
         """
-        blob = self.get_blob_client(blob_path)
-        if blob.exists():
-            with open(local_file_path, "wb" if binary else "w") as file:
-                try:
-                    file.write(blob.download_blob().readall())
-                except Exception as e:
-                    print(f"Error downloading blob: {e}")
-        else:
+        blob = self._get_blob_client_cached(blob_path)
+        try:
+            # Start the download before opening the file so a missing blob leaves no empty file behind
+            downloader = blob.download_blob(
+                max_concurrency=max_concurrency or self.max_concurrency,
+                encoding=None if binary else "utf-8",
+            )
+        except ResourceNotFoundError:
             print("Provided blob path doesn't exist.")
+            return
+        # Text is written back exactly as stored: UTF-8, with the blob's own line endings
+        file = open(local_file_path, "wb") if binary else open(local_file_path, "w", encoding="utf-8", newline="")
+        with file:
+            try:
+                if binary:
+                    # Stream chunks straight into the file instead of building the whole blob in memory
+                    _preallocate(file, downloader.size)
+                    downloader.readinto(file)
+                else:
+                    file.write(downloader.readall())
+            except Exception as e:
+                print(f"Error downloading blob: {e}")
 
-    def read_data(self, path: str, as_text=False):
+    def read_data(self, path: str, as_text=False, max_concurrency: int | None = None):
         """
         Read blob content from the given path.
 
         Args:
             path (str): Path of the blob to read.
             as_text (bool): If True, decode as UTF-8 text. Otherwise, return raw bytes.
+            max_concurrency (int, optional): Parallel connections for this download. Defaults to `self.max_concurrency`.
 
         Returns:
             bytes or str or None: Blob content or None if failed or not found.
         """
-        blob = self.get_blob_client(path)
-        if blob.exists():
+        blob = self._get_blob_client_cached(path)
+        try:
+            data, downloader = self._download_if_modified(blob, path, max_concurrency)
+            if downloader is not None:
+                data = _read_to_memory(downloader).getvalue()
+                self._cache.put(path, downloader.properties.etag, data)
+            return data.decode("utf-8") if as_text else data
+        except ResourceNotFoundError:
+            print("Provided path doesn't exist.")
+        except Exception as e:
+            print(f"Error reading blob: {e}")
+
+    async def aread_data(self, path: str, as_text=False):
+        """
+        Async version of `read_data`, using the shared async container client.
+
+        Args:
+            path (str): Path of the blob to read.
+            as_text (bool): If True, decode as UTF-8 text. Otherwise, return raw bytes.
+
+        Returns:
+            bytes or str or None: Blob content or None if failed or not found.
+        """
+        async with self:
+            container = self.aio_container
             try:
-                return (
-                    blob.download_blob(encoding="utf-8").readall()
-                    if as_text
-                    else blob.download_blob().readall()
-                )
+                async with container.get_blob_client(path) as blob:
+                    downloader = await (
+                        blob.download_blob(encoding="utf-8") if as_text else blob.download_blob()
+                    )
+                    return await downloader.readall()
+            except ResourceNotFoundError:
+                print("Provided path doesn't exist.")
             except Exception as e:
                 print(f"Error reading blob: {e}")
-        else:
-            print("Provided path doesn't exist.")
 
-    def read_data_to_memory(self, path: str):
+    async def aread_many(self, paths, as_text=False, concurrency: int = 32):
+        """
+        Read several blobs concurrently.
+
+        Args:
+            paths (Iterable[str]): Paths of the blobs to read.
+            as_text (bool): If True, decode as UTF-8 text. Otherwise, return raw bytes.
+            concurrency (int): Maximum number of downloads in flight at once. Default is 32.
+
+        Returns:
+            List[bytes or str or None]: Blob contents, in the same order as `paths`.
+
+        Example:
+            data = asyncio.run(helper.aread_many(["a.json", "b.json"]))
+
+            async def main():
+                async with helper:  # keep one client open across several calls
+                    first = await helper.aread_many(["a.json"])
+                    second = await helper.aread_many(["b.json"])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _read(path):
+            async with semaphore:
+                return await self.aread_data(path, as_text=as_text)
+
+        async with self:
+            return await asyncio.gather(*(_read(path) for path in paths))
+
+    def read_data_to_memory(self, path: str, max_concurrency: int | None = None):
         """
         Read blob content into an in-memory BytesIO stream.
 
         Args:
             path (str): Path of the blob.
+            max_concurrency (int, optional): Parallel connections for this download. Defaults to `self.max_concurrency`.
 
         Returns:
             BytesIO or None: In-memory stream of blob content.
         """
-        blob = self.get_blob_client(path)
-        if blob.exists():
-            stream = BytesIO()
-            try:
-                blob.download_blob().readinto(stream)
-                stream.seek(0)
-                return stream
-            except Exception as e:
-                print(f"Error reading blob to memory: {e}")
-        else:
+        blob = self._get_blob_client_cached(path)
+        try:
+            data, downloader = self._download_if_modified(blob, path, max_concurrency)
+            if downloader is None:
+                return BytesIO(data)
+            stream = _read_to_memory(downloader)
+            if downloader.size <= self._cache.max_item_bytes:
+                self._cache.put(path, downloader.properties.etag, stream.getvalue())
+            return stream
+        except ResourceNotFoundError:
+            print("Provided path doesn't exist.")
+        except Exception as e:
+            print(f"Error reading blob to memory: {e}")
+
+    def iter_chunks(self, path: str):
+        """
+        Yield a blob's content chunk by chunk as it downloads, without concatenating it in memory.
+        Chunks are up to `max_chunk_get_size` bytes; the first request fetches `max_single_get_size`.
+
+        Args:
+            path (str): Path of the blob.
+
+        Yields:
+            bytes: Consecutive chunks of blob content. Nothing is yielded if the blob is not found.
+
+        Example:
+            with open("local.bin", "wb") as f:
+                for chunk in helper.iter_chunks("path/in/container/blob.bin"):
+                    f.write(chunk)
+        """
+        blob = self._get_blob_client_cached(path)
+        try:
+            downloader = blob.download_blob()
+        except ResourceNotFoundError:
             print("Provided path doesn't exist.")
+            return
+        yield from downloader.chunks()
+
+    def _download_if_modified(self, blob, path: str, max_concurrency: int | None = None):
+        """
+        Start a download of `path`, conditional on the cached ETag when there is one.
 
-    def read_vtk_data(self, path: str):
+        Returns:
+            (bytes, None) if the cached content is still current, otherwise (None, downloader).
+            Either way this costs a single request.
+        Raises ResourceNotFoundError (and drops the entry) if the blob does not exist.
+        """
+        entry = self._cache.get(path)
+        conditions = {}
+        if entry is not None:
+            conditions = {"etag": entry[0], "match_condition": MatchConditions.IfModified}
+        try:
+            return None, blob.download_blob(max_concurrency=max_concurrency or self.max_concurrency, **conditions)
+        except ResourceNotFoundError:
+            self._cache.invalidate(path)
+            raise
+        except HttpResponseError as e:
+            # The storage SDK reports 304 Not Modified as a plain HttpResponseError
+            if entry is not None and e.status_code == 304:
+                return entry[1], None
+            raise
+
+    def invalidate(self, path: str):
+        """
+        Drop any locally cached content for a blob path.
+        Writes made through this helper invalidate automatically; call this after external writes.
+        Cached listings of any prefix containing the path are dropped as well.
+        """
+        self._cache.invalidate(path)
+        self._listings.invalidate(path)
+
+    def read_vtk_data(self, path: str, max_concurrency: int | None = None):
         """
         Read VTK-compatible file using PyVista from blob storage.
 
         Args:
             path (str): Path to the VTK-compatible file in blob storage.
+            max_concurrency (int, optional): Parallel connections for this download. Defaults to `self.max_concurrency`.
 
         Returns:
             pyvista.DataSet or None: PyVista dataset if successful, otherwise None.
@@ -201,20 +615,70 @@ class BlobStorageHelper:
             print("PyVista is not installed.")
             return None
 
-        blob = self.get_blob_client(path)
-        if blob.exists():
-            try:
-                data = blob.download_blob().readall()
-                with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-                    tmp.write(data)
-                    tmp_path = tmp.name
-                mesh = pv.read(tmp_path)
-                os.remove(tmp_path)
-                return mesh
-            except Exception as e:
-                print(f"Error reading VTK data: {e}")
-        else:
+        blob = self._get_blob_client_cached(path)
+        tmp_path = None
+        try:
+            downloader = blob.download_blob(max_concurrency=max_concurrency or self.max_concurrency)
+            with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
+                tmp_path = tmp.name
+                # Parallel chunks go straight to disk; no in-memory copy of the mesh file
+                _preallocate(tmp, downloader.size)
+                downloader.readinto(tmp)
+            return pv.read(tmp_path)
+        except ResourceNotFoundError:
             print("Provided path doesn't exist.")
+        except Exception as e:
+            print(f"Error reading VTK data: {e}")
+        finally:
+            if tmp_path is not None:
+                os.remove(tmp_path)
+
+    def prefetch_iter(self, paths, prefetch: int = 4, as_text=False):
+        """
+        Read blobs in order while downloading the next `prefetch` blobs in background threads,
+        so network time overlaps with whatever the caller does with each result.
+
+        Args:
+            paths (Iterable[str]): Paths of the blobs to read.
+            prefetch (int): Number of blobs downloaded ahead of the one being consumed. Default is 4.
+            as_text (bool): If True, decode as UTF-8 text. Otherwise, return raw bytes.
+
+        Yields:
+            bytes or str or None: Blob contents, as returned by `read_data`, in the order of `paths`.
+
+        Example:
+            for data in helper.prefetch_iter(paths):
+                process(data)
+        """
+        return self._prefetch(lambda path: self.read_data(path, as_text=as_text), paths, prefetch)
+
+    def prefetch_vtk_iter(self, paths, prefetch: int = 2):
+        """
+        Read VTK-compatible blobs in order, downloading and parsing the next `prefetch` files
+        in background threads.
+
+        Args:
+            paths (Iterable[str]): Paths to VTK-compatible files in blob storage.
+            prefetch (int): Number of files loaded ahead of the one being consumed. Default is 2.
+
+        Yields:
+            pyvista.DataSet or None: Datasets, as returned by `read_vtk_data`, in the order of `paths`.
+        """
+        return self._prefetch(self.read_vtk_data, paths, prefetch)
+
+    @staticmethod
+    def _prefetch(read, paths, prefetch: int):
+        executor = ThreadPoolExecutor(max_workers=max(1, prefetch))
+        pending = deque()
+        try:
+            for path in paths:
+                pending.append(executor.submit(read, path))
+                if len(pending) > prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def rename_blob(self, source: str, target: str):
         """
@@ -224,55 +688,130 @@ class BlobStorageHelper:
             source (str): Source blob path.
             target (str): Target blob path.
         """
-        source_blob = self.get_blob_client(source)
-        target_blob = self.get_blob_client(target)
+        source_blob = self._get_blob_client_cached(source)
+        target_blob = self._get_blob_client_cached(target)
 
-        target_blob.start_copy_from_url(source_blob.url)
-        while target_blob.get_blob_properties().copy.status == "pending":
-            time.sleep(0.5)
+        status = self._start_copy(source_blob, target_blob)
+        if status == "pending":
+            status = self._wait_for_copy(target_blob)
 
-        if target_blob.get_blob_properties().copy.status == "success":
+        self.invalidate(target)
+        if status == "success":
             source_blob.delete_blob()
+            self.invalidate(source)
 
-    def search_path_by_name(self, keyword: str, path: str = ""):
+    def _start_copy(self, source_blob, target_blob):
+        """
+        Start a server-side copy and return its copy status.
+
+        When the source URL can be authorized with a SAS, a synchronous copy is tried first so
+        the copy comes back already completed. Otherwise, or if the service refuses it
+        (e.g. source over 256 MiB), an asynchronous copy is started and "pending" may be returned.
+        """
+        source_url = self._authorized_source_url(source_blob)
+        if source_url is not None:
+            try:
+                return target_blob.start_copy_from_url(source_url, requires_sync=True)["copy_status"]
+            except HttpResponseError:
+                pass
+        return target_blob.start_copy_from_url(source_blob.url)["copy_status"]
+
+    def _authorized_source_url(self, source_blob):
+        """
+        Return a source URL the service can read for a synchronous copy, or None.
+        Copy Blob From URL does not accept Shared Key auth for the source, so clients built from
+        a connection string sign a short-lived read SAS; SAS-based clients already carry one.
+        """
+        url = source_blob.url
+        if "sig=" in url.partition("?")[2]:
+            return url
+        if self.created_with_connection_string:
+            account_name, container_name, account_key, _ = self._sas_ctx
+            if account_name is not None and account_key is not None:
+                sas_token = generate_blob_sas(
+                    account_name=account_name,
+                    container_name=container_name,
+                    blob_name=source_blob.blob_name,
+                    account_key=account_key,
+                    permission=BlobSasPermissions(read=True),
+                    expiry=datetime.utcnow() + timedelta(minutes=15),
+                )
+                return f"{url}?{sas_token}"
+        return None
+
+    @staticmethod
+    def _wait_for_copy(target_blob, initial_delay: float = 0.05, max_delay: float = 2.0):
+        """Poll a pending copy with exponential backoff and return its final status."""
+        delay = initial_delay
+        status = target_blob.get_blob_properties().copy.status
+        while status == "pending":
+            time.sleep(delay)
+            delay = min(delay * 2, max_delay)
+            status = target_blob.get_blob_properties().copy.status
+        return status
+
+    def search_path_by_name(self, keyword: str, path: str = "", starts_with: bool = False):
         """
         Search for blobs containing a keyword in their name.
 
         Args:
             keyword (str): Substring to search for in blob names.
             path (str, optional): If provided, limits search to blobs under this prefix.
+            starts_with (bool): If True, only match blobs whose path under `path` begins with `keyword`.
+                The filter is then applied by the service, so only matching names are listed.
 
         Returns:
             List[str]: List of matching blob paths.
         """
         prefix = path.rstrip("/") + "/" if path else ""
-        return [
-            blob.name
-            for blob in self.container_client.list_blobs(name_starts_with=prefix)
-            if keyword in blob.name
-        ]
+        if starts_with:
+            prefix, keyword = prefix + keyword, ""
+        # Reuse a fresh cached listing of this prefix or any ancestor of it
+        names = self._listings.get_covering("blobs", prefix)
+        if names is not None:
+            return [name for name in names if name.startswith(prefix) and keyword in name]
+        return [name for name in self._iter_blobs(prefix) if keyword in name]
     
-    def upload_local_file_to_blob(self, local_file_path: str, blob_file_path: str, overwrite: bool = True):
+    def upload_local_file_to_blob(
+        self, local_file_path: str, blob_file_path: str, overwrite: bool = True, max_concurrency: int | None = None
+    ):
         """
         Uploads a file from the local filesystem to the specified blob path in the container.
         """
-        blob_client = self.get_blob_client(blob_file_path)
-        with open(local_file_path, "rb") as f:
-            blob_client.upload_blob(f, overwrite=overwrite)
+        blob_client = self._get_blob_client_cached(blob_file_path)
+        size = os.path.getsize(local_file_path)
+        # Read in 4 MiB blocks to match the SDK's upload chunk size; a known length lets it
+        # plan the block list and upload blocks in parallel without probing the stream
+        try:
+            with open(local_file_path, "rb", buffering=4 * 1024 * 1024) as f:
+                blob_client.upload_blob(
+                    f, length=size, overwrite=overwrite, max_concurrency=max_concurrency or self.max_concurrency
+                )
+        finally:
+            # After the write, so a read or listing that raced with the upload isn't left cached
+            self.invalidate(blob_file_path)
 
-    def upload_stream_to_blob(self, file_data, blob_file_path, overwrite: bool = True):
+    def upload_stream_to_blob(
+        self, file_data, blob_file_path, overwrite: bool = True, max_concurrency: int | None = None
+    ):
         """
         Uploads a file-like object to the specified blob path in the base container.
         Args:
             file_data: A file-like object (e.g., BytesIO, file handle).
             blob_file_path (str): The destination path for the blob in the container.
             overwrite (bool): Whether to overwrite the blob if it already exists. Default is True.
+            max_concurrency (int, optional): Parallel connections for this upload. Defaults to `self.max_concurrency`.
         Example:
             with open("local_file.txt", "rb") as f:
                 upload_stream_to_blob(f, "path/in/container/blob.txt")
         """
-        blob_client = self.get_blob_client(blob_file_path)
-        blob_client.upload_blob(file_data, overwrite=overwrite)
+        blob_client = self._get_blob_client_cached(blob_file_path)
+        try:
+            blob_client.upload_blob(
+                file_data, overwrite=overwrite, max_concurrency=max_concurrency or self.max_concurrency
+            )
+        finally:
+            self.invalidate(blob_file_path)
         
     def copy_blob_to_path(self, source_blob_client, target_blob_path):
         """
@@ -282,40 +821,139 @@ class BlobStorageHelper:
             source_blob_client: The BlobClient instance of the source blob.
             target_blob_path (str): The destination path for the new blob.
         """
-        target_blob_client = self.get_blob_client(target_blob_path)
-        target_blob_client.start_copy_from_url(source_blob_client.url)
+        target_blob_client = self._get_blob_client_cached(target_blob_path)
+        try:
+            target_blob_client.start_copy_from_url(source_blob_client.url)
+        finally:
+            self.invalidate(target_blob_path)
+
+    def copy_blobs_parallel(
+        self, pairs, max_inflight: int = 256, max_workers: int = 32,
+        initial_delay: float = 0.05, max_delay: float = 2.0,
+    ):
+        """
+        Copy many blobs within the container using concurrent server-side copies.
+
+        Up to `max_inflight` copies are outstanding at once, and a new copy starts as soon as one
+        finishes. Copies with an authorized source complete synchronously; any left pending are
+        polled with exponential backoff without blocking the other slots.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): (source blob path, target blob path) pairs.
+            max_inflight (int): Maximum number of copies outstanding on the service at once. Default is 256.
+            max_workers (int): Threads used to issue and poll requests. Default is 32.
+            initial_delay (float): First poll interval in seconds for a pending copy. Default is 0.05.
+            max_delay (float): Longest poll interval in seconds. Default is 2.
+
+        Returns:
+            Dict[str, str]: Final copy status ("success", "failed", "aborted") keyed by target path,
+                or the error message if the copy could not be started or polled.
+        """
+        if max_inflight < 1 or max_workers < 1:
+            raise ValueError("max_inflight and max_workers must both be at least 1.")
+        pairs = deque(pairs)
+        statuses = {}
+
+        def _start(source, target):
+            try:
+                return self._start_copy(
+                    self._get_blob_client_cached(source), self._get_blob_client_cached(target)
+                )
+            except Exception as e:
+                return str(e)
 
-    def generate_blob_sas_url(self, blob_path, expiry_hours=24):
+        def _poll(target):
+            try:
+                return self._get_blob_client_cached(target).get_blob_properties().copy.status
+            except Exception as e:
+                return str(e)
+
+        running = {}  # future -> (target, delay before the next poll)
+        scheduled = []  # heap of (poll time, tie-breaker, target, delay) for pending copies
+        order = itertools.count()
+        inflight = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pairs or running or scheduled:
+                while pairs and inflight < max_inflight:
+                    source, target = pairs.popleft()
+                    running[executor.submit(_start, source, target)] = (target, initial_delay)
+                    inflight += 1
+                now = time.monotonic()
+                while scheduled and scheduled[0][0] <= now:
+                    _, _, target, delay = heapq.heappop(scheduled)
+                    running[executor.submit(_poll, target)] = (target, min(delay * 2, max_delay))
+                timeout = max(0.0, scheduled[0][0] - now) if scheduled else None
+                if not running:
+                    time.sleep(timeout)
+                    continue
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    target, delay = running.pop(future)
+                    status = future.result()
+                    if status == "pending":
+                        heapq.heappush(scheduled, (time.monotonic() + delay, next(order), target, delay))
+                    else:
+                        statuses[target] = status
+                        # Only once the copy has settled, so nothing read mid-copy stays cached
+                        self.invalidate(target)
+                        inflight -= 1
+        return statuses
+
+    def generate_blob_sas_url(self, blob_path, expiry_hours=24, check_exists=False):
         """
-        Generate a SAS token for a blob given its path in the container, only if the blob exists.
+        Generate a SAS token for a blob given its path in the container.
 
         Args:
             blob_path (str): Path of the blob in the container.
             expiry_hours (int): Expiry time in hours.
+            check_exists (bool): If True, verify the blob exists first (one extra request). Default is False.
 
         Returns:
-            str: SAS URL for the blob, or None if blob does not exist.
+            str: SAS URL for the blob, or None if it cannot be generated or the blob does not exist.
         """
-        from datetime import datetime, timedelta
-        if self.created_with_connection_string:
-            blob_client = self.get_blob_client(blob_path)
-            if not blob_client.exists():
-                print(f"Blob '{blob_path}' does not exist.")
+        if check_exists and not self._get_blob_client_cached(blob_path).exists():
+            print(f"Blob '{blob_path}' does not exist.")
+            return None
+        return self._blob_sas_url(blob_path, datetime.utcnow() + timedelta(hours=expiry_hours))
+
+    def generate_blob_sas_urls(self, blob_paths, expiry_hours=24):
+        """
+        Generate SAS URLs for many blobs at once, sharing a single expiry time.
+        Blobs are not checked for existence.
+
+        Args:
+            blob_paths (List[str]): Paths of the blobs in the container.
+            expiry_hours (int): Expiry time in hours.
+
+        Returns:
+            Dict[str, str]: Mapping of blob path to SAS URL, or None if SAS URLs cannot be generated.
+        """
+        expiry = datetime.utcnow() + timedelta(hours=expiry_hours)
+        sas_urls = {}
+        for blob_path in blob_paths:
+            sas_url = self._blob_sas_url(blob_path, expiry)
+            if sas_url is None:
                 return None
-            
-            if self.container_client.account_name is None or self.container_client.credential.account_key is None:
+            sas_urls[blob_path] = sas_url
+        return sas_urls
+
+    def _blob_sas_url(self, blob_path, expiry):
+        """Build the SAS URL for a blob with the given expiry datetime."""
+        if self.created_with_connection_string:
+            account_name, container_name, account_key, container_url = self._sas_ctx
+            if account_name is None or account_key is None:
                 print("Account name or key is not set, cannot generate SAS token.")
                 return None
 
             sas_token = generate_blob_sas(
-                account_name=self.container_client.account_name,
-                container_name=self.container_client.container_name,
+                account_name=account_name,
+                container_name=container_name,
                 blob_name=blob_path,
-                account_key=self.container_client.credential.account_key,
+                account_key=account_key,
                 permission=BlobSasPermissions(read=True, write=True, delete=True),
-                expiry=datetime.utcnow() + timedelta(hours=expiry_hours),
+                expiry=expiry,
             )
-            sas_url = f"https://{self.container_client.account_name}.blob.core.windows.net/{self.container_client.container_name}/{blob_path}?{sas_token}"
+            sas_url = f"{container_url}/{blob_path}?{sas_token}"
         elif self.created_with_sas_token:
             base_url, _, sas_token = self.sas_url.partition('?')
             base_url = base_url.rstrip('/')
@@ -337,21 +975,54 @@ class BlobStorageHelper:
         Returns:
             bool: True if deleted, False if blob does not exist or user cancels.
         """
-        blob_client = self.get_blob_client(blob_path)
-        if not blob_client.exists():
-            print(f"Blob '{blob_path}' does not exist.")
-            return False
-
+        blob_client = self._get_blob_client_cached(blob_path)
         if not force:
             confirm = input(f"Are you sure you want to delete blob '{blob_path}'? (y/N): ").strip().lower()
             if confirm != 'y':
                 print("Deletion cancelled.")
                 return False
 
-        blob_client.delete_blob()
+        self.invalidate(blob_path)
+        try:
+            blob_client.delete_blob()
+        except ResourceNotFoundError:
+            print(f"Blob '{blob_path}' does not exist.")
+            return False
         print(f"Blob '{blob_path}' deleted.")
         return True
 
+    def delete_blobs(self, blob_paths, chunk: int = 256, verbose=False):
+        """
+        Delete several blobs using batch requests, without confirmation.
+
+        Args:
+            blob_paths (List[str]): Paths of the blobs in the container.
+            chunk (int): Number of deletions packed into one batch request. The service maximum is 256.
+            verbose (bool): If True, print the outcome for each blob.
+
+        Returns:
+            List[str]: Paths that were deleted.
+        """
+        blob_paths = list(blob_paths)
+        deleted = []
+        for i in range(0, len(blob_paths), chunk):
+            batch = blob_paths[i:i + chunk]
+            try:
+                responses = self.container_client.delete_blobs(*batch, raise_on_any_failure=False)
+            except HttpResponseError as e:
+                # The service rejected the whole batch: none of its blobs were deleted
+                print(f"Error deleting batch of {len(batch)} blobs: {e}")
+                continue
+            for name, response in zip(batch, responses):
+                self.invalidate(name)
+                if response.status_code < 300:
+                    deleted.append(name)
+                    if verbose:
+                        print(f"Deleted: {name}")
+                elif verbose:
+                    print(f"Could not delete {name}: HTTP {response.status_code}")
+        return deleted
+
     def delete_directory(self, directory_path, verbose=False):
         container_client = self.container_client
 
@@ -367,45 +1038,32 @@ class BlobStorageHelper:
         if verbose:
             print(f"Deleting all blobs under '{dir_prefix}'...")
 
-        for blob_ in container_client.list_blobs(name_starts_with=dir_prefix):
-            if len(list(container_client.list_blobs(name_starts_with=blob_.name))) > 1:
-                if verbose:
-                    print(f"Skipping non-empty directory: {blob_.name}")
-                continue
-            # delete real blobs and empty directories
-            try:
-                container_client.delete_blob(blob_.name)
-                if verbose:
-                    print(f"Deleted: {blob_.name}")
-            except Exception as e:
-                if verbose:
-                    print(f"Could not delete {blob_.name}: {e}")
-
-        if directory_path.endswith('/'):
-            dir_prefix = directory_path
-            dir_name_no_slash = directory_path.rstrip('/')
-        else:
-            dir_prefix = directory_path + '/'
-            dir_name_no_slash = directory_path
+        # Blob storage has no real directories: every listed name is a deletable blob,
+        # so list once and delete in batches (the service accepts up to 256 per batch)
+        names = [blob_.name for blob_ in container_client.list_blobs(name_starts_with=dir_prefix)]
+        deleted = set(self.delete_blobs(names, verbose=verbose))
+        failed = [name for name in names if name not in deleted]
+        if failed:
+            # Real directory entries (hierarchical namespace) can't be deleted before their
+            # contents, so retry one level at a time, deepest first
+            if verbose:
+                print(f"Retrying {len(failed)} blobs deepest first...")
+            depths = {name: name.rstrip('/').count('/') for name in failed}
+            for level in sorted(set(depths.values()), reverse=True):
+                self.delete_blobs([name for name in failed if depths[name] == level], verbose=verbose)
 
-        if len(list(container_client.list_blobs(name_starts_with=dir_prefix))) > 1:
-            self.delete_directory(dir_prefix)
-        
         # Delete the directory marker blob (if any)
         if verbose:
             print(f"Checking for directory marker for '{directory_path}'...")
-        marker_candidates = list(container_client.list_blobs(name_starts_with=dir_name_no_slash))
-        for blob in marker_candidates:
-            # The marker blob is usually the directory name itself, optionally with trailing slash
-            if blob.name.rstrip('/') == dir_name_no_slash:
-                try:
-                    container_client.delete_blob(blob.name)
-                    if verbose:
-                        print(f"Deleted directory marker: '{blob.name}'")
-                except Exception as e:
-                    if verbose:
-                        print(f"Could not delete directory marker {blob.name}: {e}")
-                break
-        else:
+        # The marker blob is the directory name itself (the trailing-slash form was listed above)
+        self.invalidate(dir_name_no_slash)
+        try:
+            container_client.delete_blob(dir_name_no_slash)
+            if verbose:
+                print(f"Deleted directory marker: '{dir_name_no_slash}'")
+        except ResourceNotFoundError:
+            if verbose:
+                print(f"No directory marker found for: {directory_path}")
+        except Exception as e:
             if verbose:
-                print(f"No directory marker found for: {directory_path}")
\ No newline at end of file
+                print(f"Could not delete directory marker {dir_name_no_slash}: {e}")
\ No newline at end of file
@@ -0,0 +1,568 @@
+import asyncio
+import base64
+import gc
+import hashlib
+import io
+import re
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+import pytest
+from azure.storage.blob import generate_blob_sas
+
+from pyazure.storage.blob import BlobStorageHelper, _ListingCache
+
+ACCOUNT = "devstoreaccount1"
+CONTAINER = "data"
+ACCOUNT_KEY = base64.b64encode(b"0" * 64).decode()
+
+
+class FakeBlobService(ThreadingHTTPServer):
+    """Minimal in-process stand-in for the Blob service: single-blob GET/HEAD/PUT/DELETE, List Blobs and batch deletes."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.blobs = {}  # name -> (etag, data)
+        self.requests = []  # (method, blob name, status)
+        self.sync_copy_limit = None  # sources larger than this are refused for synchronous copy
+        self.copy_polls = {}  # target name -> number of property reads still reporting "pending"
+        self.fail_batches = 0  # number of upcoming batch requests to reject as a whole
+        self.list_queries = []  # query parameters of each List Blobs request
+        self.lock = threading.Lock()
+
+    def put(self, name, data):
+        with self.lock:
+            self.blobs[name] = ('"0x%s"' % hashlib.md5(data).hexdigest()[:16].upper(), data)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _blob_name(self):
+        path = unquote(urlsplit(self.path).path)
+        prefix = f"/{ACCOUNT}/{CONTAINER}/"
+        return path[len(prefix):] if path.startswith(prefix) else None
+
+    def _reply(self, status, body=b"", headers=None):
+        self.server.requests.append((self.command, self._blob_name(), status))
+        self.send_response(status)
+        headers = dict(headers or {})
+        headers.setdefault("x-ms-version", "2025-01-05")
+        headers.setdefault("Date", formatdate(usegmt=True))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _not_found(self):
+        self._reply(404, headers={"x-ms-error-code": "BlobNotFound"})
+
+    def _properties(self, etag, size):
+        return {
+            "ETag": etag,
+            "Last-Modified": formatdate(usegmt=True),
+            "x-ms-blob-type": "BlockBlob",
+            "Content-Type": "application/octet-stream",
+            "x-ms-creation-time": formatdate(usegmt=True),
+        }
+
+    def do_GET(self):
+        query = {key: values[0] for key, values in parse_qs(urlsplit(self.path).query).items()}
+        if query.get("comp") == "list":
+            return self._list(query)
+        entry = self.server.blobs.get(self._blob_name())
+        if entry is None:
+            return self._not_found()
+        etag, data = entry
+        if self.headers.get("If-None-Match") == etag:
+            return self._reply(304, headers={"ETag": etag})
+        headers = self._properties(etag, len(data))
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("x-ms-range") or self.headers.get("Range") or "")
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2) or len(data) - 1), len(data) - 1)
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+            return self._reply(206, data[start:end + 1], headers)
+        self._reply(200, data, headers)
+
+    def _list(self, query):
+        self.server.list_queries.append(query)
+        prefix = query.get("prefix", "")
+        names = sorted(name for name in self.server.blobs if name.startswith(prefix) and name > query.get("marker", ""))
+        page = names[:int(query.get("maxresults", 5000))]
+        xml = [
+            f'<?xml version="1.0" encoding="utf-8"?><EnumerationResults ContainerName="{CONTAINER}">'
+            f"<Prefix>{escape(prefix)}</Prefix><Marker>{escape(query.get('marker', ''))}</Marker>"
+            f"<MaxResults>{query.get('maxresults', '')}</MaxResults><Blobs>"
+        ]
+        for name in page:
+            etag, data = self.server.blobs[name]
+            xml.append(
+                f"<Blob><Name>{escape(name)}</Name><Properties><Etag>{escape(etag)}</Etag>"
+                f"<Content-Length>{len(data)}</Content-Length><BlobType>BlockBlob</BlobType></Properties></Blob>"
+            )
+        next_marker = page[-1] if len(names) > len(page) else ""
+        xml.append(f"</Blobs><NextMarker>{escape(next_marker)}</NextMarker></EnumerationResults>")
+        self._reply(200, "".join(xml).encode(), {"Content-Type": "application/xml"})
+
+    def do_HEAD(self):
+        entry = self.server.blobs.get(self._blob_name())
+        if entry is None:
+            return self._not_found()
+        etag, data = entry
+        headers = self._properties(etag, len(data))
+        headers["Content-Length"] = str(len(data))
+        polls = self.server.copy_polls.get(self._blob_name())
+        if polls is not None:
+            headers["x-ms-copy-id"] = "copy-1"
+            headers["x-ms-copy-status"] = "pending" if polls else "success"
+            self.server.copy_polls[self._blob_name()] = max(0, polls - 1)
+        self.server.requests.append((self.command, self._blob_name(), 200))
+        self.send_response(200)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        copy_source = self.headers.get("x-ms-copy-source")
+        if copy_source:
+            return self._copy(copy_source)
+        self.server.put(self._blob_name(), body)
+        self._reply(201, headers={"ETag": self.server.blobs[self._blob_name()][0]})
+
+    def _copy(self, copy_source):
+        source = urlsplit(copy_source)
+        requires_sync = (self.headers.get("x-ms-requires-sync") or "").lower() == "true"
+        if requires_sync and "sig=" not in source.query:
+            # Copy Blob From URL cannot use the destination's Shared Key to read the source
+            return self._reply(403, headers={"x-ms-error-code": "CannotVerifyCopySource"})
+        entry = self.server.blobs.get(unquote(source.path)[len(f"/{ACCOUNT}/{CONTAINER}/"):])
+        if entry is None:
+            return self._not_found()
+        limit = self.server.sync_copy_limit
+        if requires_sync and limit is not None and len(entry[1]) > limit:
+            return self._reply(409, headers={"x-ms-error-code": "CannotVerifyCopySource"})
+        self.server.put(self._blob_name(), entry[1])
+        headers = {"ETag": self.server.blobs[self._blob_name()][0], "x-ms-copy-id": "copy-1"}
+        if requires_sync:
+            headers["x-ms-copy-status"] = "success"
+        else:
+            self.server.copy_polls[self._blob_name()] = 4
+            headers["x-ms-copy-status"] = "pending"
+        self._reply(202, headers=headers)
+
+    def do_DELETE(self):
+        if self.server.blobs.pop(self._blob_name(), None) is None:
+            return self._not_found()
+        self._reply(202)
+
+    def do_POST(self):
+        # Blob Batch: a multipart/mixed body of DELETE sub-requests, answered with one part each
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0)).decode()
+        if self.server.fail_batches:
+            self.server.fail_batches -= 1
+            return self._reply(400, headers={"x-ms-error-code": "InvalidInput"})
+        request_boundary = self.headers["Content-Type"].split("boundary=")[1]
+        boundary = "batchresponse_fake"
+        parts = []
+        for part in body.split(f"--{request_boundary}")[1:-1]:
+            content_id = re.search(r"Content-ID: (\d+)", part).group(1)
+            path = re.search(r"DELETE (\S+) HTTP/1.1", part).group(1)
+            name = unquote(urlsplit(path).path)[len(f"/{ACCOUNT}/{CONTAINER}/"):]
+            with self.server.lock:
+                status, reason = (202, "Accepted") if self.server.blobs.pop(name, None) else (404, "Not Found")
+            self.server.requests.append(("DELETE", name, status))
+            parts.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\nContent-ID: {content_id}\r\n\r\n"
+                f"HTTP/1.1 {status} {reason}\r\nx-ms-version: 2025-01-05\r\n"
+                + ("x-ms-error-code: BlobNotFound\r\n" if status == 404 else "")
+                + "Content-Length: 0\r\n\r\n"
+            )
+        self._reply(
+            202,
+            ("".join(parts) + f"--{boundary}--\r\n").encode(),
+            {"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        )
+
+
+@pytest.fixture
+def service():
+    server = FakeBlobService()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def conn_str(service):
+    host, port = service.server_address
+    return (
+        f"DefaultEndpointsProtocol=http;AccountName={ACCOUNT};AccountKey={ACCOUNT_KEY};"
+        f"BlobEndpoint=http://{host}:{port}/{ACCOUNT};"
+    )
+
+
+@pytest.fixture
+def helper(conn_str):
+    return BlobStorageHelper(conn_str=conn_str, container=CONTAINER)
+
+
+def test_read_data_twice_serves_unchanged_blob_from_cache(helper, service):
+    service.put("a.txt", b"hello")
+
+    assert helper.read_data("a.txt") == b"hello"
+    assert helper.read_data("a.txt") == b"hello"
+    assert helper.read_data("a.txt", as_text=True) == "hello"
+    assert helper.read_data_to_memory("a.txt").read() == b"hello"
+    # Only the first read transferred the body; later reads were answered with 304
+    assert [status for method, _, status in service.requests if method == "GET"] == [206, 304, 304, 304]
+
+
+def test_read_data_refetches_changed_blob(helper, service):
+    service.put("a.txt", b"hello")
+    assert helper.read_data("a.txt") == b"hello"
+
+    service.put("a.txt", b"changed")
+    assert helper.read_data("a.txt") == b"changed"
+
+
+def test_read_data_missing_blob_returns_none(helper):
+    assert helper.read_data("missing.txt") is None
+
+
+@pytest.mark.filterwarnings("error::ResourceWarning", "error::pytest.PytestUnraisableExceptionWarning")
+def test_aread_many_across_event_loops(helper, service):
+    service.put("a.txt", b"a")
+    service.put("b.txt", b"b")
+
+    assert asyncio.run(helper.aread_many(["a.txt", "b.txt"])) == [b"a", b"b"]
+    assert asyncio.run(helper.aread_data("b.txt")) == b"b"
+
+    async def main():
+        async with helper:
+            first = await helper.aread_many(["a.txt"])
+            container = helper.aio_container
+            second = await helper.aread_many(["b.txt"])
+            assert helper.aio_container is container
+        return first + second
+
+    assert asyncio.run(main()) == [b"a", b"b"]
+    assert helper._aio_container is None
+    gc.collect()
+
+
+def test_aio_container_from_another_loop_must_be_closed_first(helper):
+    async def leak():
+        return helper.aio_container
+
+    container = asyncio.run(leak())
+    with pytest.raises(RuntimeError, match="aclose"):
+        asyncio.run(helper.aread_data("a.txt"))
+    assert helper._aio_container is container
+    asyncio.run(container.close())
+
+
+def test_rename_blob_uses_a_single_synchronous_copy(helper, service):
+    service.put("old.txt", b"data")
+
+    helper.rename_blob("old.txt", "new.txt")
+
+    assert service.blobs["new.txt"][1] == b"data"
+    assert "old.txt" not in service.blobs
+    assert [(method, status) for method, _, status in service.requests] == [("PUT", 202), ("DELETE", 202)]
+
+
+def test_listing_cache_drops_expired_and_least_recent_entries(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("pyazure.storage.blob.time.monotonic", lambda: now[0])
+    cache = _ListingCache(ttl=30, max_entries=2)
+
+    cache.put("blobs", "a/", ["a/1"])
+    cache.put("blobs", "b/", ["b/1"])
+    cache.put("blobs", "c/", ["c/1"])
+    assert cache.get("blobs", "a/") is None
+    assert cache.get_covering("blobs", "c/x/") == ["c/1"]
+
+    now[0] = 31.0
+    assert cache.get("blobs", "c/") is None
+    assert len(cache._entries) == 1
+    cache.put("blobs", "d/", ["d/1"])
+    assert list(cache._entries) == [("blobs", "d/")]
+
+
+def test_listing_cache_invalidate_is_thread_safe():
+    cache = _ListingCache(ttl=30, max_entries=1000)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(500):
+                cache.put("blobs", f"{n}/{i}/", [])
+                cache.invalidate(f"{n}/{i - 1}/x")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_delete_directory_retries_non_empty_directories_deepest_first(helper, monkeypatch):
+    remaining = {"dir/sub", "dir/sub/x", "dir/sub/deeper", "dir/sub/deeper/y", "dir/z"}
+    listed = sorted(remaining)
+
+    class Listed:
+        def __init__(self, name):
+            self.name = name
+
+    def fake_delete_blobs(blob_paths, chunk=256, verbose=False):
+        # Like a hierarchical-namespace account: a directory with children can't be deleted,
+        # and the order within one batch is not guaranteed
+        snapshot = set(remaining)
+        deleted = [name for name in blob_paths if not any(other.startswith(name + "/") for other in snapshot)]
+        remaining.difference_update(deleted)
+        return deleted
+
+    monkeypatch.setattr(helper.container_client, "list_blobs", lambda name_starts_with: map(Listed, listed))
+    monkeypatch.setattr(helper.container_client, "delete_blob", lambda name: None)
+    monkeypatch.setattr(helper, "delete_blobs", fake_delete_blobs)
+
+    helper.delete_directory("dir")
+
+    assert remaining == set()
+
+
+def test_copy_blobs_parallel_refills_slots_and_polls_pending_copies(helper, service):
+    service.sync_copy_limit = 4
+    service.put("big.bin", b"0123456789")
+    for i in range(5):
+        service.put(f"small{i}.txt", b"s")
+    pairs = [("big.bin", "copy/big.bin")] + [(f"small{i}.txt", f"copy/small{i}.txt") for i in range(5)]
+
+    statuses = helper.copy_blobs_parallel(pairs, max_inflight=2, max_workers=2, initial_delay=0.01)
+
+    assert statuses == {target: "success" for _, target in pairs}
+    assert all(service.blobs[target][1] == service.blobs[source][1] for source, target in pairs)
+    # The small copies went through while the big one was still pending
+    heads = [i for i, (method, _, _) in enumerate(service.requests) if method == "HEAD"]
+    last_small_put = max(i for i, (method, name, _) in enumerate(service.requests)
+                         if method == "PUT" and name.startswith("copy/small"))
+    assert heads and heads[-1] > last_small_put
+
+
+def test_download_blob_to_local_binary_and_text(helper, service, tmp_path):
+    data = "café\r\nline 2\n".encode("utf-8")
+    service.put("a.txt", data)
+
+    helper.download_blob_to_local("a.txt", tmp_path / "binary.txt")
+    helper.download_blob_to_local("a.txt", tmp_path / "text.txt", binary=False)
+
+    assert (tmp_path / "binary.txt").read_bytes() == data
+    # Text mode keeps the UTF-8 encoding and the original line endings on every platform
+    assert (tmp_path / "text.txt").read_bytes() == data
+
+
+def test_download_blob_to_local_missing_blob_leaves_no_file(helper, tmp_path):
+    helper.download_blob_to_local("missing.txt", tmp_path / "missing.txt")
+    helper.download_blob_to_local("missing.txt", tmp_path / "missing_text.txt", binary=False)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_delete_blobs_batches_and_reports_failures(helper, service):
+    names = [f"dir/{i:03}.txt" for i in range(300)]
+    for name in names:
+        service.put(name, b"x")
+
+    deleted = helper.delete_blobs(names + ["dir/missing.txt"])
+
+    assert deleted == names
+    assert service.blobs == {}
+    # 301 deletions go out as a full batch of 256 and a second batch of 45
+    assert [status for method, _, status in service.requests if method == "POST"] == [202, 202]
+    assert ("DELETE", "dir/missing.txt", 404) in service.requests
+
+
+def test_delete_blobs_skips_a_rejected_batch(helper, service):
+    names = [f"{i}.txt" for i in range(3)]
+    for name in names:
+        service.put(name, b"x")
+    service.fail_batches = 1
+
+    assert helper.delete_blobs(names, chunk=2) == ["2.txt"]
+    assert sorted(service.blobs) == ["0.txt", "1.txt"]
+
+
+def test_generate_blob_sas_urls_signs_each_blob_with_one_expiry(helper, service):
+    paths = ["a.txt", "dir/b c.txt"]
+
+    urls = helper.generate_blob_sas_urls(paths, expiry_hours=1)
+
+    assert list(urls) == paths
+    queries = {path: parse_qs(urlsplit(url).query) for path, url in urls.items()}
+    assert urls["a.txt"].startswith(f"https://{ACCOUNT}.blob.core.windows.net/{CONTAINER}/a.txt?")
+    assert len({query["se"][0] for query in queries.values()}) == 1
+    for path, query in queries.items():
+        expected = generate_blob_sas(
+            account_name=ACCOUNT,
+            container_name=CONTAINER,
+            blob_name=path,
+            account_key=ACCOUNT_KEY,
+            permission=query["sp"][0],
+            expiry=query["se"][0],
+        )
+        assert query["sig"] == parse_qs(expected)["sig"]
+    # Nothing is checked against the service
+    assert service.requests == []
+
+
+def test_generate_blob_sas_urls_reuses_the_container_sas_token(service):
+    host, port = service.server_address
+    helper = BlobStorageHelper(sas_url=f"http://{host}:{port}/{ACCOUNT}/{CONTAINER}/?sp=r&sig=abc")
+
+    assert helper.generate_blob_sas_urls(["a.txt", "dir/b.txt"]) == {
+        "a.txt": f"http://{host}:{port}/{ACCOUNT}/{CONTAINER}/a.txt?sp=r&sig=abc",
+        "dir/b.txt": f"http://{host}:{port}/{ACCOUNT}/{CONTAINER}/dir/b.txt?sp=r&sig=abc",
+    }
+
+
+def test_upload_drops_listings_cached_while_it_was_running(helper, service, monkeypatch):
+    blob_client = helper._get_blob_client_cached("dir/new.txt")
+    upload_blob = blob_client.upload_blob
+
+    def racing_upload(*args, **kwargs):
+        helper._listings.put("blobs", "dir/", [])  # a listing that completed mid-upload
+        return upload_blob(*args, **kwargs)
+
+    monkeypatch.setattr(blob_client, "upload_blob", racing_upload)
+    helper.upload_stream_to_blob(io.BytesIO(b"new"), "dir/new.txt")
+
+    assert service.blobs["dir/new.txt"][1] == b"new"
+    assert helper._listings.get("blobs", "dir/") is None
+
+
+def test_search_path_by_name_starts_with_filters_on_the_service(helper, service):
+    for name in ["dir/abc1.txt", "dir/abd.txt", "dir/xabc.txt", "other/abc.txt"]:
+        service.put(name, b"x")
+
+    assert helper.search_path_by_name("ab", path="dir", starts_with=True) == ["dir/abc1.txt", "dir/abd.txt"]
+    assert helper.search_path_by_name("abc", path="dir/") == ["dir/abc1.txt", "dir/xabc.txt"]
+    assert [query.get("prefix") for query in service.list_queries] == ["dir/ab", "dir/"]
+
+
+def test_iter_blobs_pages_lazily_5000_at_a_time(helper, service):
+    names = [f"p/{i:05}" for i in range(5003)]
+    for name in names:
+        service.put(name, b"")
+
+    blobs = helper.iter_blobs("p/")
+    assert next(blobs) == names[0]
+    assert len(service.list_queries) == 1
+    assert [names[0]] + list(blobs) == names
+    assert [query["maxresults"] for query in service.list_queries] == ["5000", "5000"]
+    assert service.list_queries[1]["marker"] == names[4999]
+
+
+def test_search_path_by_name_filters_a_cached_ancestor_listing(helper, service):
+    for name in ["dir/sub/abc.txt", "dir/sub/xabc.txt", "dir/subway/abc.txt", "dir/abc.txt"]:
+        service.put(name, b"x")
+    helper.list_blobs("dir/")
+
+    assert helper.search_path_by_name("abc", path="dir/sub") == ["dir/sub/abc.txt", "dir/sub/xabc.txt"]
+    assert helper.search_path_by_name("ab", path="dir/sub", starts_with=True) == ["dir/sub/abc.txt"]
+    # Both searches were answered from the cached listing of "dir/"
+    assert len(service.list_queries) == 1
+
+
+def test_prefetch_iter_yields_in_order_with_none_for_missing_blobs(helper, service, monkeypatch):
+    paths = [f"{i}.txt" for i in range(6)]
+    for path in paths:
+        if path != "3.txt":
+            service.put(path, path.encode())
+    read_data = helper.read_data
+
+    def slow_early_reads(path, as_text=False):
+        time.sleep(0.05 * (6 - int(path[0])) / 6)  # earlier blobs finish last
+        return read_data(path, as_text=as_text)
+
+    monkeypatch.setattr(helper, "read_data", slow_early_reads)
+
+    assert list(helper.prefetch_iter(paths, prefetch=3)) == [b"0.txt", b"1.txt", b"2.txt", None, b"4.txt", b"5.txt"]
+
+
+def test_prefetch_vtk_iter_yields_in_order(helper, monkeypatch):
+    monkeypatch.setattr(helper, "read_vtk_data", lambda path: None if path == "b.vtk" else path.upper())
+
+    assert list(helper.prefetch_vtk_iter(["a.vtk", "b.vtk", "c.vtk"])) == ["A.VTK", None, "C.VTK"]
+
+
+def test_abandoned_prefetch_iter_stops_reading_ahead(helper, monkeypatch):
+    started = []
+    release = threading.Event()
+
+    def read_data(path, as_text=False):
+        started.append(path)
+        if path != "0":
+            release.wait(5)
+        return path
+
+    def paths():
+        for i in range(100):
+            yield str(i)
+
+    monkeypatch.setattr(helper, "read_data", read_data)
+    results = helper.prefetch_iter(paths(), prefetch=2)
+    assert next(results) == "0"
+
+    threading.Timer(0.1, release.set).start()
+    results.close()  # waits for the reads in flight; nothing past the prefetch window is started
+
+    time.sleep(0.1)
+    assert sorted(started) == ["0", "1", "2"]
+
+
+def test_iter_chunks_streams_the_blob_in_get_size_pieces(conn_str, service):
+    helper = BlobStorageHelper(conn_str=conn_str, container=CONTAINER, max_single_get_size=4, max_chunk_get_size=3)
+    service.put("a.bin", b"0123456789")
+
+    # The first GET fetches 4 bytes; every chunk handed out is at most max_chunk_get_size
+    assert list(helper.iter_chunks("a.bin")) == [b"012", b"345", b"678", b"9"]
+    assert [status for method, _, status in service.requests if method == "GET"] == [206, 206, 206]
+    assert list(helper.iter_chunks("missing.bin")) == []
+
+
+@pytest.mark.parametrize("limits", [{"max_inflight": 0}, {"max_workers": 0}])
+def test_copy_blobs_parallel_rejects_empty_limits(helper, limits):
+    with pytest.raises(ValueError):
+        helper.copy_blobs_parallel([("a.txt", "b.txt")], **limits)
+
+
+def test_copy_blobs_parallel_drops_listings_cached_during_the_copy(helper, service, monkeypatch):
+    service.put("a.txt", b"a")
+    start_copy = helper._start_copy
+
+    def racing_start_copy(source_blob, target_blob):
+        helper._listings.put("blobs", "copy/", [])  # a listing that completed mid-copy
+        return start_copy(source_blob, target_blob)
+
+    monkeypatch.setattr(helper, "_start_copy", racing_start_copy)
+
+    assert helper.copy_blobs_parallel([("a.txt", "copy/a.txt")]) == {"copy/a.txt": "success"}
+    assert helper._listings.get("blobs", "copy/") is None